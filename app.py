@@ -1,12 +1,9 @@
-from flask import Flask, request, jsonify
-from inshorts import getNews, get_categories
+from flask import Flask, Response, request, jsonify
+import orjson
 from flask_cors import CORS
 from dotenv import load_dotenv
 import os
 import logging
-from logging.handlers import RotatingFileHandler
-from functools import wraps
-import traceback
 import sys
 from flask_socketio import SocketIO
 import time
@@ -14,88 +11,20 @@ import time
 # Load environment variables
 load_dotenv()
 
+# Imported after load_dotenv so .env cache settings are picked up
+from inshorts import getNews, get_categories
+from common import setup_logging, NewsAPIError, CategoryNotFoundError, handle_errors
+
 # Configure default limits
 DEFAULT_NEWS_LIMIT = int(os.getenv('DEFAULT_NEWS_LIMIT', 30))
 MAX_NEWS_LIMIT = int(os.getenv('MAX_NEWS_LIMIT', 100))
 
 # Configure logging
-def setup_logging():
-    """
-    Configures rotating file logging system with separate files for:
-    - app.log: All application logs (10MB max, 10 backups)
-    - error.log: Error-specific logs
-    """
-    log_dir = 'logs'
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # File handler for all logs
-    file_handler = RotatingFileHandler(
-        'logs/app.log', 
-        maxBytes=10485760,  # 10MB
-        backupCount=10
-    )
-    file_handler.setFormatter(formatter)
-    
-    # Error file handler
-    error_handler = RotatingFileHandler(
-        'logs/error.log',
-        maxBytes=10485760,
-        backupCount=10
-    )
-    error_handler.setFormatter(formatter)
-    error_handler.setLevel(logging.ERROR)
-    
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_handler)
-    
-    return root_logger
-
 logger = setup_logging()
 
-# Custom error classes
-class NewsAPIError(Exception):
-    """
-    Base exception for API-specific errors
-    Provides consistent error response structure with status codes
-    """
-    def __init__(self, message, status_code=500):
-        self.message = message
-        self.status_code = status_code
-        super().__init__(self.message)
-
-class CategoryNotFoundError(NewsAPIError):
-    """Raised when category is missing or invalid"""
-    def __init__(self, message="Category parameter is required or is invalid"):
-        super().__init__(message, status_code=404)
-
-# Error handler decorator
-def handle_errors(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        try:
-            return f(*args, **kwargs)
-        except NewsAPIError as e:
-            logger.error(f"API Error: {str(e)}")
-            return jsonify({
-                "error": str(e),
-                "status": "error"
-            }), e.status_code
-        except Exception as e:
-            # Log the full traceback for unexpected errors
-            logger.error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
-            return jsonify({
-                "error": "An unexpected error occurred",
-                "status": "error"
-            }), 500
-    return decorated_function
+def orjsonify(obj, status=200):
+    """JSON response serialized with orjson, for large payloads like /news"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -105,13 +34,15 @@ CORS(app)
 # Request logging middleware
 @app.before_request
 def log_request_info():
-    logger.info(f'Request: {request.method} {request.url}')
-    logger.debug(f'Headers: {dict(request.headers)}')
-    logger.debug(f'Body: {request.get_data()}')
+    logger.info('Request: %s %s', request.method, request.url)
+    # Only materialize headers and body when DEBUG output is actually on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Headers: %s', dict(request.headers))
+        logger.debug('Body: %s', request.get_data())
 
 @app.after_request
 def log_response_info(response):
-    logger.info(f'Response: {response.status}')
+    logger.info('Response: %s', response.status)
     return response
 
 @app.route('/')
@@ -147,40 +78,35 @@ def news():
         
         try:
             news_data = getNews(category, limit)
-            logger.info(f"Successfully fetched news for category: {category} with limit: {limit}")
-            return jsonify(news_data), 200
+            logger.info("Successfully fetched news for category: %s with limit: %d", category, limit)
+            return orjsonify(news_data)
         except Exception as e:
-            logger.error(f"Error fetching news for category {category}: {str(e)}")
+            logger.error("Error fetching news for category %s: %s", category, e)
             raise NewsAPIError(f"Failed to fetch news for category: {category}")
 
+# Categories are static, so the /categories body is serialized once
+_CATEGORIES_JSON = orjson.dumps({
+    "status": "success",
+    "data": get_categories()['categories']
+})
+
 @app.route('/categories')
 @handle_errors
 def get_available_categories():
     """
     Returns list of all available news categories
-    Falls back to predefined categories if dynamic fetch fails
+    Served from JSON precomputed at startup, cacheable by clients for a day
     """
-    try:
-        categories_data = get_categories()
-        
-        if categories_data['success']:
-            logger.info("Successfully fetched dynamic categories")
-        else:
-            logger.warning("Using fallback categories")
-            
-        return jsonify({
-            "status": "success",
-            "data": categories_data['categories']
-        }), 200
-        
-    except Exception as e:
-        logger.error(f"Error fetching categories: {str(e)}")
-        raise NewsAPIError("Failed to fetch categories")
+    return Response(
+        _CATEGORIES_JSON,
+        mimetype='application/json',
+        headers={'Cache-Control': 'public, max-age=86400'}
+    )
 
 # Error handlers for common HTTP errors
 @app.errorhandler(404)
 def not_found_error(error):
-    logger.error(f"404 Error: {request.url}")
+    logger.error("404 Error: %s", request.url)
     return jsonify({
         "error": "Resource not found",
         "status": "error"
@@ -188,7 +114,7 @@ def not_found_error(error):
 
 @app.errorhandler(405)
 def method_not_allowed_error(error):
-    logger.error(f"405 Error: {request.method} {request.url}")
+    logger.error("405 Error: %s %s", request.method, request.url)
     return jsonify({
         "error": "Method not allowed",
         "status": "error"
@@ -196,25 +122,52 @@ def method_not_allowed_error(error):
 
 @app.errorhandler(500)
 def internal_error(error):
-    logger.error(f"500 Error: {str(error)}\n{traceback.format_exc()}")
+    logger.exception("500 Error: %s", error)
     return jsonify({
         "error": "Internal server error",
         "status": "error"
     }), 500
 
-socketio = SocketIO(app)
+# Threading by default; wsgi.py switches to gevent under gunicorn
+socketio = SocketIO(app, async_mode=os.getenv('SOCKETIO_ASYNC_MODE', 'threading'))
 
 @app.route('/start-task')
 def start_task():
+    """
+    WebSocket endpoint for long-running tasks
+    Emits progress events (0-100) to connected clients
+    Handles task completion and error notifications
+    """
     def background_task():
-        for i in range(100):
-            time.sleep(0.1)
-            socketio.emit('progress', {'progress': i})
+        try:
+            # Emit every 5th tick (ending on 99) rather than on every tick
+            for i in range(100):
+                time.sleep(0.1)
+                if i % 5 == 4:
+                    socketio.emit('progress', {'progress': i})
+            socketio.emit('complete', {'status': 'success'})
+        except Exception as e:
+            logger.error("Background task error: %s", e)
+            socketio.emit('error', {'message': 'Task failed'})
     
     socketio.start_background_task(background_task)
-    return jsonify({'message': 'Task started'})
+    return jsonify({'message': 'Task started', 'status': 'success'})
 
 if __name__ == '__main__':
-    debug = os.getenv('FLASK_ENV') == 'development'
-    port = int(os.getenv('FLASK_PORT', 5001))
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    try:
+        debug = os.getenv('FLASK_ENV') == 'development'
+        port = int(os.getenv('FLASK_PORT', 5001))
+        
+        if not debug:
+            # The Werkzeug dev server is not fit for production traffic
+            logger.critical(
+                "Refusing to start the development server outside DEBUG mode; "
+                "run gunicorn -k gevent -w 1 wsgi:app instead"
+            )
+            sys.exit(1)
+            
+        logger.info("Starting server in DEBUG mode on port %d", port)
+        socketio.run(app, host='0.0.0.0', port=port, debug=debug, allow_unsafe_werkzeug=debug)
+    except Exception as e:
+        logger.critical("Failed to start server: %s", e)
+        sys.exit(1)
@@ -0,0 +1,3 @@
+# Shared logging and error handling used by the app and its services
+from common.logging_setup import FastRotatingFileHandler, setup_logging
+from common.errors import NewsAPIError, CategoryNotFoundError, handle_errors
@@ -0,0 +1,42 @@
+from flask import jsonify
+from functools import wraps
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Custom error classes
+class NewsAPIError(Exception):
+    """
+    Base exception for API-specific errors
+    Provides consistent error response structure with status codes
+    """
+    def __init__(self, message, status_code=500):
+        self.message = message
+        self.status_code = status_code
+        super().__init__(self.message)
+
+class CategoryNotFoundError(NewsAPIError):
+    """Raised when category is missing or invalid"""
+    def __init__(self, message="Category parameter is required or is invalid"):
+        super().__init__(message, status_code=404)
+
+# Error handler decorator
+def handle_errors(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except NewsAPIError as e:
+            logger.error("API Error: %s", e)
+            return jsonify({
+                "error": str(e),
+                "status": "error"
+            }), e.status_code
+        except Exception as e:
+            # Log the full traceback for unexpected errors
+            logger.exception("Unexpected error: %s", e)
+            return jsonify({
+                "error": "An unexpected error occurred",
+                "status": "error"
+            }), 500
+    return decorated_function
@@ -0,0 +1,82 @@
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+# Listener started by the first setup_logging call
+_listener = None
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that decides on rollover from the stream position
+    instead of formatting every record a second time to measure it
+    """
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            return self.stream.tell() >= self.maxBytes
+        except OSError:
+            return False
+
+def setup_logging():
+    """
+    Configures rotating file logging system with separate files for:
+    - app.log: All application logs (10MB max, 10 backups)
+    - error.log: Error-specific logs
+    
+    Records are queued by the request thread and written to the files by a
+    background QueueListener, keeping file I/O off the request path.
+    
+    Safe to call more than once: later calls return the already configured
+    root logger instead of attaching duplicate handlers.
+    """
+    global _listener
+    root_logger = logging.getLogger()
+    if _listener is not None:
+        return root_logger
+    
+    log_dir = 'logs'
+    if not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+    
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # File handler for all logs
+    file_handler = FastRotatingFileHandler(
+        'logs/app.log', 
+        maxBytes=10485760,  # 10MB
+        backupCount=10
+    )
+    file_handler.setFormatter(formatter)
+    
+    # Error file handler
+    error_handler = FastRotatingFileHandler(
+        'logs/error.log',
+        maxBytes=10485760,
+        backupCount=10
+    )
+    error_handler.setFormatter(formatter)
+    error_handler.setLevel(logging.ERROR)
+    
+    # Hand records to a background listener that owns the file handlers
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(
+        log_queue,
+        file_handler,
+        error_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    # Configure root logger
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    return root_logger
@@ -60,7 +60,10 @@ PACKAGES=(
   "Werkzeug"
   "gunicorn"
   "flask-cors"
-  "pytz"
+  "orjson"
+  "flask-socketio"
+  "gevent"
+  "tzdata"
 )
 
 # Function to check if package is installed
@@ -1,19 +1,24 @@
 import datetime
-import uuid
+import itertools
+import secrets
+import orjson
 import requests
-import pytz
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import time
 import os
-import sys
-from flask_socketio import SocketIO
-from flask import Flask, request, jsonify
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
 # Core service for fetching and processing news from Inshorts
 # Handles API interactions, data transformation, and caching
-CATEGORIES = [
+CATEGORIES = (
     'all',
     'india',
     'national',
@@ -33,7 +38,11 @@ CATEGORIES = [
     'fashion',
     'education',
     'health & fitness'
-]
+)
+
+# Precomputed lookup set and error message for category validation
+_CATEGORY_SET = frozenset(CATEGORIES)
+_INVALID_CATEGORY_MSG = f'Invalid category. Must be one of: {", ".join(CATEGORIES)} or "all"'
 
 headers = {
     'authority': 'inshorts.com',
@@ -49,17 +58,176 @@ headers = {
     'user-agent': 'Mozilla/5.0'
 }
 
-def handle_errors(func):
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
+IST = ZoneInfo('Asia/Kolkata')
+DATE_FORMAT = '%A, %d %B, %Y'
+TIME_FORMAT = '%I:%M %p'
+
+# Fallback article IDs for entries without an upstream hash_id
+_ID_PREFIX = secrets.token_hex(4)
+_ID_COUNTER = itertools.count()
+
+# Upstream request timeouts in seconds: (connect, read)
+REQUEST_TIMEOUT = (3, 10)
+
+# Longest wait in seconds between upstream retries, including Retry-After
+MAX_RETRY_WAIT = 5
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After but never sleeps past MAX_RETRY_WAIT"""
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_WAIT)
+
+# Shared session so connections to inshorts.com are pooled and kept alive
+# across pages and across requests. Requests only back off (exponentially,
+# honouring a capped Retry-After) when inshorts answers 429 or 5xx.
+session = requests.Session()
+session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=CappedRetry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_max=MAX_RETRY_WAIT,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+
+# Seconds a cached response is served as fresh, and how much longer it may
+# be served stale while a background refresh runs
+NEWS_CACHE_TTL = int(os.getenv('NEWS_CACHE_TTL', 90))
+NEWS_CACHE_STALE_TTL = int(os.getenv('NEWS_CACHE_STALE_TTL', 300))
+# Most (category, limit) responses kept before evicting the least recently used
+NEWS_CACHE_MAX_ENTRIES = int(os.getenv('NEWS_CACHE_MAX_ENTRIES', 256))
+
+# Shared pool for fetching category pages in parallel. Each request keeps
+# at most PAGES_IN_FLIGHT pages running, so a limit=100 request can't take
+# over the pool and concurrent /news requests still make progress.
+PAGE_FETCH_WORKERS = int(os.getenv('PAGE_FETCH_WORKERS', 32))
+PAGES_IN_FLIGHT = 4
+_page_executor = ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS)
+
+_news_cache = OrderedDict()
+_news_cache_lock = threading.Lock()
+# Keys with a fetch running, mapped to the _PendingFetch tracking it
+_in_flight = {}
+
+# Longest time in seconds a request waits on another request's fetch
+NEWS_FETCH_WAIT_TIMEOUT = 30
+
+class _PendingFetch:
+    """A running fetch: done is set once result holds its outcome"""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+def _cache_lookup(key):
+    """Returns (age, result) for key, dropping it if past the stale window"""
+    with _news_cache_lock:
+        cached = _news_cache.get(key)
+        if cached is None:
+            return None
+        age = time.monotonic() - cached[0]
+        if age >= NEWS_CACHE_TTL + NEWS_CACHE_STALE_TTL:
+            del _news_cache[key]
+            return None
+        _news_cache.move_to_end(key)
+        return age, cached[1]
+
+def _cache_store(key, result):
+    """Stores result, then evicts expired and least recently used entries"""
+    now = time.monotonic()
+    max_age = NEWS_CACHE_TTL + NEWS_CACHE_STALE_TTL
+    with _news_cache_lock:
+        _news_cache[key] = (now, result)
+        _news_cache.move_to_end(key)
+        expired = [k for k, (stored_at, _) in _news_cache.items() if now - stored_at >= max_age]
+        for k in expired:
+            del _news_cache[k]
+        while len(_news_cache) > NEWS_CACHE_MAX_ENTRIES:
+            _news_cache.popitem(last=False)
+
+def _claim_fetch(key):
+    """
+    Registers a fetch for key
+    
+    Returns (pending, True) if the caller now owns the fetch, or the running
+    fetch's (pending, False) if another thread already does
+    """
+    with _news_cache_lock:
+        pending = _in_flight.get(key)
+        if pending is not None:
+            return pending, False
+        pending = _in_flight[key] = _PendingFetch()
+        return pending, True
+
+def _refresh_news(func, key, pending):
+    """
+    Runs the wrapped fetch, caches the result if it has articles and hands
+    it to any requests waiting on pending
+    """
+    try:
+        result = func(*key)
+        # Empty data usually means inshorts is failing; never cache it, so
+        # an outage can't replace good articles with an empty list
+        if result.get('success') and result.get('data'):
+            _cache_store(key, result)
+        pending.result = result
+        return result
+    finally:
+        with _news_cache_lock:
+            _in_flight.pop(key, None)
+        pending.done.set()
+
+def cache_news(func):
+    """
+    Caches news responses with articles in a bounded LRU keyed on
+    (category, limit)
+    
+    Fresh entries are returned directly. Entries older than NEWS_CACHE_TTL
+    but within NEWS_CACHE_STALE_TTL are returned stale while a background
+    thread refreshes them, so warm keys never wait on inshorts.com. Misses
+    for a key that is already being fetched wait for that fetch instead of
+    starting another, and share its result even when it isn't cached.
+    """
+    @wraps(func)
+    def wrapper(category, limit=30):
+        key = (category.lower(), limit)
+        cached = _cache_lookup(key)
+        if cached is not None:
+            age, result = cached
+            if age >= NEWS_CACHE_TTL:
+                pending, owner = _claim_fetch(key)
+                if owner:
+                    threading.Thread(
+                        target=_refresh_news, args=(func, key, pending), daemon=True
+                    ).start()
+            return result
+
+        pending, owner = _claim_fetch(key)
+        if owner:
+            return _refresh_news(func, key, pending)
+
+        # Reuse the running fetch's outcome, cached or not, rather than
+        # calling inshorts.com again while it is likely failing
+        if not pending.done.wait(NEWS_FETCH_WAIT_TIMEOUT):
+            return {
+                'success': False,
+                'error': 'Timed out waiting for news'
+            }
+        if pending.result is None:
             return {
                 'success': False,
-                'error': str(e)
+                'error': 'Failed to fetch news'
             }
+        return pending.result
     return wrapper
 
+@cache_news
 def getNews(category, limit=30):
     """
     Fetches and processes news articles from Inshorts
@@ -75,10 +243,10 @@ def getNews(category, limit=30):
         - data: List of processed news articles
     """
     category = category.lower()
-    if category != 'all' and category not in CATEGORIES:
+    if category not in _CATEGORY_SET:
         return {
             'success': False,
-            'error': f'Invalid category. Must be one of: {", ".join(CATEGORIES)} or "all"'
+            'error': _INVALID_CATEGORY_MSG
         }
         
     newsDictionary = {
@@ -90,8 +258,9 @@ def getNews(category, limit=30):
     try:
         if category == 'all':
             # Original all news endpoint
-            response = requests.get(
+            response = session.get(
                 'https://inshorts.com/api/en/news',
+                timeout=REQUEST_TIMEOUT,
                 params={
                     'category': 'all_news',
                     'max_limit': str(limit),
@@ -99,105 +268,115 @@ def getNews(category, limit=30):
                 }
             )
             
-            news_data = response.json().get('data', {}).get('news_list', [])
+            news_data = orjson.loads(response.content).get('data', {}).get('news_list', [])
             if not news_data:
                 newsDictionary['success'] = False
                 newsDictionary['error'] = 'No news found'
                 return newsDictionary
 
-            for entry in news_data[:limit]:
-                try:
-                    news = entry['news_obj']
-                    newsObject = create_news_object(news)
-                    newsDictionary['data'].append(newsObject)
-                except Exception as e:
-                    logger.error(f"Error processing news entry: {str(e)}")
-                    continue
+            newsDictionary['data'] = build_news_list(news_data[:limit])
         else:
-            # Category-specific news with pagination
+            # Category-specific news, fetching pages concurrently
             collected_news = []
-            offset = 0
             batch_size = 10
 
-            while len(collected_news) < limit:
-                # Get trending topics first
-                trending_response = requests.get(
-                    'https://inshorts.com/api/en/trending_topics',
-                    headers=headers
-                )
-                
-                if trending_response.status_code != 200:
-                    break
+            offsets = range(0, limit, batch_size)
 
-                response = requests.get(
-                    f'https://inshorts.com/api/en/search/trending_topics/{category}',
-                    headers=headers,
-                    params={
-                        'category': 'top_stories',
-                        'max_limit': str(batch_size),
-                        'include_card_data': 'true',
-                        'news_offset': str(offset),
-                        'size': str(batch_size)
-                    }
+            # Fetch pages in waves of PAGES_IN_FLIGHT; the last page only
+            # asks for what is left of the limit
+            for start in range(0, len(offsets), PAGES_IN_FLIGHT):
+                pages = _page_executor.map(
+                    lambda offset: fetch_category_page(
+                        category, offset, min(batch_size, limit - offset)
+                    ),
+                    offsets[start:start + PAGES_IN_FLIGHT]
                 )
-
-                if response.status_code != 200:
-                    break
-
-                news_data = response.json().get('data', {}).get('news_list', [])
-                if not news_data:
-                    break
-
-                collected_news.extend(news_data)
-                if len(collected_news) >= limit:
+                # Stop at the first empty page, as the serial loop did
+                exhausted = False
+                for news_data in pages:
+                    if not news_data:
+                        exhausted = True
+                        break
+                    collected_news.extend(news_data)
+                if exhausted:
                     break
 
-                offset += batch_size
-                time.sleep(0.1)  # Small delay to prevent rate limiting
-
             # Process collected news
-            for entry in collected_news[:limit]:
-                try:
-                    news = entry['news_obj']
-                    newsObject = create_news_object(news)
-                    newsDictionary['data'].append(newsObject)
-                except Exception as e:
-                    logger.error(f"Error processing news entry: {str(e)}")
-                    continue
+            newsDictionary['data'] = build_news_list(collected_news[:limit])
 
         return newsDictionary
 
     except Exception as e:
-        logger.error(f"Error fetching news: {str(e)}")
+        logger.error("Error fetching news: %s", e)
         newsDictionary['success'] = False
         newsDictionary['error'] = str(e)
         return newsDictionary
 
+def fetch_category_page(category, offset, batch_size):
+    """
+    Fetches a single page of category news
+    
+    Returns the raw news_list, or an empty list if the page is unavailable
+    """
+    response = session.get(
+        f'https://inshorts.com/api/en/search/trending_topics/{category}',
+        headers=headers,
+        timeout=REQUEST_TIMEOUT,
+        params={
+            'category': 'top_stories',
+            'max_limit': str(batch_size),
+            'include_card_data': 'true',
+            'news_offset': str(offset),
+            'size': str(batch_size)
+        }
+    )
+
+    if response.status_code != 200:
+        return []
+
+    return orjson.loads(response.content).get('data', {}).get('news_list', [])
+
+def build_news_list(entries):
+    """Converts raw news_list entries to news objects, skipping malformed ones"""
+    news_list = []
+    for entry in entries:
+        try:
+            news_list.append(create_news_object(entry['news_obj']))
+        except Exception as e:
+            logger.error("Error processing news entry: %s", e)
+    return news_list
+
+@lru_cache(maxsize=1024)
+def format_ist_minute(minute):
+    """
+    Formats an epoch minute as IST (date, time) strings
+    
+    Articles share a minute often enough across pages and cached refreshes
+    that memoizing skips most datetime construction and strftime calls
+    """
+    dt_ist = datetime.datetime.fromtimestamp(minute * 60, tz=IST)
+    return dt_ist.strftime(DATE_FORMAT), dt_ist.strftime(TIME_FORMAT).lower()
+
 def create_news_object(news):
     """
     Transforms raw API response into standardized news format
     
     Handles:
     - Timezone conversion (UTC to IST)
-    - Unique ID generation
+    - ID assignment (upstream hash_id, else a per-process counter)
     - Data structure normalization
     """
-    timestamp = news['created_at'] / 1000
-    dt_utc = datetime.datetime.utcfromtimestamp(timestamp)
-    tz_utc = pytz.timezone('UTC')
-    dt_utc = tz_utc.localize(dt_utc)
-    tz_ist = pytz.timezone('Asia/Kolkata')
-    dt_ist = dt_utc.astimezone(tz_ist)
+    date, time_of_day = format_ist_minute(news['created_at'] // 60000)
     
     return {
-        'id': uuid.uuid4().hex,
+        'id': news.get('hash_id') or f"{_ID_PREFIX}{next(_ID_COUNTER):x}",
         'title': news['title'],
         'imageUrl': news['image_url'],
         'url': news['shortened_url'],
         'content': news['content'],
         'author': news['author_name'],
-        'date': dt_ist.strftime('%A, %d %B, %Y'),
-        'time': dt_ist.strftime('%I:%M %p').lower(),
+        'date': date,
+        'time': time_of_day,
         'readMoreUrl': news['source_url']
     }
 
@@ -209,51 +388,8 @@ def get_categories():
             'categories': CATEGORIES
         }
     except Exception as e:
-        logger.error(f"Error getting categories: {str(e)}")
+        logger.error("Error getting categories: %s", e)
         return {
             'success': False,
             'categories': []
         }
-
-app = Flask(__name__)
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
-
-@app.route('/')
-@handle_errors
-def home():
-    return 'News API is UP!<br><br>A part of <a href="https://t.me/sjprojects">Sj Projects</a>'
-
-@app.route('/start-task')
-def start_task():
-    """
-    WebSocket endpoint for long-running tasks
-    Emits progress events (0-100) to connected clients
-    Handles task completion and error notifications
-    """
-    def background_task():
-        try:
-            for i in range(100):
-                time.sleep(0.1)
-                socketio.emit('progress', {'progress': i})
-            socketio.emit('complete', {'status': 'success'})
-        except Exception as e:
-            logger.error(f"Background task error: {str(e)}")
-            socketio.emit('error', {'message': 'Task failed'})
-    
-    socketio.start_background_task(background_task)
-    return jsonify({'message': 'Task started', 'status': 'success'})
-
-if __name__ == '__main__':
-    try:
-        debug = os.getenv('FLASK_ENV') == 'development'
-        port = int(os.getenv('FLASK_PORT', 5001))
-        
-        if debug:
-            logger.info(f"Starting server in DEBUG mode on port {port}")
-        else:
-            logger.info(f"Starting server in PRODUCTION mode on port {port}")
-            
-        socketio.run(app, host='0.0.0.0', port=port, debug=debug)
-    except Exception as e:
-        logger.critical(f"Failed to start server: {str(e)}")
-        sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,12 @@
+# Production entrypoint for gunicorn's gevent worker:
+#   gunicorn -k gevent -w 1 wsgi:app
+# Monkey-patching must happen before anything imports socket, ssl or
+# threading so requests, time.sleep and the page fetch pool cooperate.
+from gevent import monkey
+monkey.patch_all()
+
+import os
+
+os.environ.setdefault('SOCKETIO_ASYNC_MODE', 'gevent')
+
+from app import app, socketio  # noqa: E402